@@ -7,17 +7,46 @@ WARNING: This script is for EDUCATIONAL PURPOSES ONLY
 """
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import json
 import time
 import csv
 import re
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 import random
+from concurrent.futures import ThreadPoolExecutor
+from http_utils import mount_retrying_adapter, response_html
+
+# Optional on-disk HTTP cache
+try:
+    import requests_cache
+    CACHE_AVAILABLE = True
+except ImportError:
+    CACHE_AVAILABLE = False
+    print("requests-cache not installed, pages will not be cached. Install with: pip install requests-cache")
+
+# Patterns used while parsing pages, compiled once at import time
+_RE_AMOUNT = re.compile(r'\$?([\d,]+)')
+_RE_DOLLAR = re.compile(r'\$([\d,]+)')
+_RE_CREATED = re.compile(r'Created|Started')
+
+CSV_FIELDS = ['id', 'title', 'url', 'image_url', 'amount_raised',
+              'description', 'created_date', 'days_running']
 
 class GoFundMeScraper:
-    def __init__(self):
+    def __init__(self, max_workers=8, cache_name='gofundme_cache', cache_expire_after=86400,
+                 csv_file='gofundme_animal_campaigns.csv', jsonl_file='gofundme_animal_campaigns.jsonl'):
+        """
+        Initialize the scraper
+        
+        Args:
+            max_workers: Maximum number of campaign detail pages fetched concurrently
+            cache_name: SQLite file used to cache downloaded pages (None disables caching)
+            cache_expire_after: Seconds before a cached page is downloaded again
+            csv_file: CSV file each campaign is appended to as soon as it is scraped (None to disable)
+            jsonl_file: JSON Lines file each campaign is appended to as soon as it is scraped (None to disable)
+        """
         self.base_url = "https://www.gofundme.com"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -28,52 +57,139 @@ class GoFundMeScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
-        self.session = requests.Session()
+        if CACHE_AVAILABLE and cache_name:
+            # Reruns and resumed scrapes read unchanged pages from disk
+            self.session = requests_cache.CachedSession(cache_name, backend='sqlite', expire_after=cache_expire_after)
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        mount_retrying_adapter(self.session, pool_maxsize=max(32, max_workers))
         self.campaigns = []
+        self.max_workers = max_workers
+        # Per-worker pause before each detail page; shorter than a serial scraper
+        # would use because the pool already spreads page fetches over max_workers
+        self.detail_delay = (1, 2)
+        self.page_delay = (5, 10)
+        
+        self.csv_file = csv_file
+        self.jsonl_file = jsonl_file
+        self._csv_handle = None
+        self._csv_writer = None
+        self._jsonl_handle = None
         
     def random_delay(self, min_seconds=2, max_seconds=5):
         """Implement random delays to appear more human-like"""
         time.sleep(random.uniform(min_seconds, max_seconds))
     
-    def extract_campaign_data(self, campaign_element) -> Dict:
-        """Extract data from a single campaign card"""
+    def write_campaign(self, campaign: Dict):
+        """Append one campaign to the output files, opening them on the first row"""
+        if self.csv_file:
+            if self._csv_writer is None:
+                self._csv_handle = open(self.csv_file, 'w', newline='', encoding='utf-8')
+                self._csv_writer = csv.DictWriter(self._csv_handle, fieldnames=CSV_FIELDS, extrasaction='ignore')
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(campaign)
+            self._csv_handle.flush()
+        
+        if self.jsonl_file:
+            if self._jsonl_handle is None:
+                self._jsonl_handle = open(self.jsonl_file, 'w', encoding='utf-8')
+            self._jsonl_handle.write(json.dumps(campaign, ensure_ascii=False) + '\n')
+            self._jsonl_handle.flush()
+    
+    def close_output(self):
+        """Close the streamed output files"""
+        for handle in (self._csv_handle, self._jsonl_handle):
+            if handle:
+                handle.close()
+                print(f"Data saved to {handle.name}")
+        self._csv_handle = self._csv_writer = self._jsonl_handle = None
+    
+    def update_delays(self, response):
+        """Tune the polite delays to the rate-limit headroom the server reports"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None or not remaining.isdigit():
+            return
+        
+        remaining = int(remaining)
+        if remaining > 20:
+            self.detail_delay, self.page_delay = (0.5, 1), (1, 2)
+        elif remaining < 5:
+            self.detail_delay, self.page_delay = (3, 6), (5, 10)
+    
+    def days_since(self, iso_date: str) -> Optional[int]:
+        """Days elapsed since an ISO-8601 timestamp, or None if it can't be parsed"""
+        try:
+            created = datetime.fromisoformat(iso_date.replace('Z', '+00:00'))
+            return (datetime.now() - created.replace(tzinfo=None)).days
+        except ValueError:
+            return None
+    
+    def card_scopes(self, campaign_link) -> List:
+        """The link node, then each enclosing node that contains no other campaign link"""
+        scopes = [campaign_link]
+        node = campaign_link.parent
+        while node is not None and node.tag != 'html' and len(node.css('a[href*="/f/"]')) <= 1:
+            scopes.append(node)
+            node = node.parent
+        return scopes
+    
+    def first_in_scopes(self, scopes: List, selector: str):
+        """First match for selector in the narrowest scope that has one"""
+        for scope in scopes:
+            elem = scope.css_first(selector)
+            if elem is not None:
+                return elem
+        return None
+    
+    def extract_campaign_data(self, campaign_link) -> Dict:
+        """Extract data from a single campaign card link node"""
         try:
             data = {}
             
             # Extract campaign URL and ID
-            link = campaign_element.find('a', class_=re.compile('.*Campaign.*'))
-            if link and link.get('href'):
-                data['url'] = self.base_url + link['href']
-                data['id'] = link['href'].split('/')[-1]
+            href = campaign_link.attributes.get('href')
+            if href:
+                href = href.split('?')[0].rstrip('/')
+                data['url'] = href if href.startswith('http') else self.base_url + href
+                data['id'] = href.split('/')[-1]
             else:
                 return None
             
+            # Look inside the link first, then in ancestors that hold no other campaign link
+            scopes = self.card_scopes(campaign_link)
+            
             # Extract image URL
-            img = campaign_element.find('img')
+            img = self.first_in_scopes(scopes, 'img')
             if img:
-                data['image_url'] = img.get('src') or img.get('data-src', '')
+                data['image_url'] = img.attributes.get('src') or img.attributes.get('data-src') or ''
             else:
                 data['image_url'] = ''
             
             # Extract title/description
-            title_elem = campaign_element.find('div', class_=re.compile('.*title.*|.*heading.*', re.IGNORECASE))
-            if not title_elem:
-                title_elem = campaign_element.find('h2') or campaign_element.find('h3')
-            data['title'] = title_elem.get_text(strip=True) if title_elem else ''
+            title_elem = self.first_in_scopes(scopes, 'div[class*="title"], div[class*="heading"], h2, h3')
+            data['title'] = title_elem.text(strip=True) if title_elem else ''
             
             # Extract amount raised
-            amount_elem = campaign_element.find('span', class_=re.compile('.*raised.*|.*amount.*', re.IGNORECASE))
-            if not amount_elem:
-                # Look for any element with $ symbol
-                amount_elem = campaign_element.find(text=re.compile(r'\$[\d,]+'))
+            amount_elem = self.first_in_scopes(scopes, 'span[class*="raised"], span[class*="amount"]')
             
+            # One text fetch of the narrowest element, then one regex pass over it;
+            # without a dedicated element, look for any text with $ symbol
+            amount_match = None
             if amount_elem:
-                amount_text = amount_elem if isinstance(amount_elem, str) else amount_elem.get_text()
-                # Extract numeric value
-                amount_match = re.search(r'\$?([\d,]+)', amount_text)
-                data['amount_raised'] = amount_match.group(1).replace(',', '') if amount_match else '0'
+                amount_match = _RE_AMOUNT.search(amount_elem.text(separator=' ', strip=True))
             else:
-                data['amount_raised'] = '0'
+                for scope in scopes:
+                    amount_match = _RE_DOLLAR.search(scope.text(separator=' ', strip=True))
+                    if amount_match:
+                        break
+            
+            # Extract numeric value
+            amount_digits = amount_match.group(1).replace(',', '') if amount_match else ''
+            # Numeric copy for totals; amount_raised keeps the string form used in the output files
+            data['amount_int'] = int(amount_digits) if amount_digits else 0
+            data['amount_raised'] = str(data['amount_int'])
             
             return data
             
@@ -85,54 +201,61 @@ class GoFundMeScraper:
         """Fetch detailed information from individual campaign page"""
         try:
             print(f"Fetching details from: {campaign_url}")
-            self.random_delay(3, 6)  # Longer delay for individual pages
-            
-            response = self.session.get(campaign_url, headers=self.headers, timeout=15)
+            response = self.session.get(campaign_url, timeout=15)
             response.raise_for_status()
+            self.update_delays(response)
+            
+            # Only real network fetches count against the site; cached pages skip the delay
+            if not getattr(response, 'from_cache', False):
+                self.random_delay(*self.detail_delay)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = LexborHTMLParser(response_html(response))
             details = {}
             
             # Try to find JSON-LD structured data (most reliable)
-            json_ld = soup.find('script', type='application/ld+json')
+            json_ld = tree.css_first('script[type="application/ld+json"]')
             if json_ld:
                 try:
-                    structured_data = json.loads(json_ld.string)
-                    details['description'] = structured_data.get('description', '')
+                    structured_data = json.loads(json_ld.text())
+                    if structured_data.get('description'):
+                        details['description'] = structured_data['description']
+                    published = structured_data.get('datePublished') or structured_data.get('dateCreated')
+                    if published:
+                        details['created_date'] = published
+                        details['days_running'] = self.days_since(published)
                 except:
                     pass
             
-            # Fallback: Extract description from page
-            if not details.get('description'):
-                desc_elem = soup.find('div', class_=re.compile('.*description.*|.*story.*', re.IGNORECASE))
+            # Fallbacks below only walk the DOM for fields JSON-LD did not supply
+            if details.get('description') is None:
+                desc_elem = tree.css_first('div[class*="description"], div[class*="story"]')
                 if desc_elem:
-                    details['description'] = desc_elem.get_text(strip=True)[:500]  # Limit length
+                    details['description'] = desc_elem.text(strip=True)[:500]  # Limit length
                 else:
                     details['description'] = ''
             
             # Extract campaign duration/creation date
-            date_elem = soup.find(text=re.compile(r'Created|Started'))
-            if date_elem:
-                # Look for date near this text
-                parent = date_elem.find_parent()
-                if parent:
-                    date_text = parent.get_text()
-                    details['created_date'] = date_text
-            else:
+            if details.get('created_date') is None:
                 details['created_date'] = 'Unknown'
+                byline = tree.css_first('span.m-campaign-byline-created')
+                if byline:
+                    details['created_date'] = byline.text(separator=' ', strip=True)
+                elif tree.body:
+                    # Slow path: test every text node for Created/Started
+                    for node in tree.body.traverse(include_text=True):
+                        if node.tag == '-text' and _RE_CREATED.search(node.text_content or ''):
+                            # Look for date near this text
+                            if node.parent:
+                                details['created_date'] = node.parent.text()
+                            break
             
             # Calculate days running (if possible)
-            meta_created = soup.find('meta', property='article:published_time')
-            if meta_created:
-                created_date = meta_created.get('content')
-                try:
-                    created = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                    days_running = (datetime.now() - created.replace(tzinfo=None)).days
-                    details['days_running'] = days_running
-                except:
+            if details.get('days_running') is None:
+                meta_created = tree.css_first('meta[property="article:published_time"]')
+                if meta_created:
+                    details['days_running'] = self.days_since(meta_created.attributes.get('content') or '')
+                if details.get('days_running') is None:
                     details['days_running'] = 'Unknown'
-            else:
-                details['days_running'] = 'Unknown'
             
             return details
             
@@ -146,24 +269,22 @@ class GoFundMeScraper:
         
         try:
             print(f"Scraping page {page_num}: {url}")
-            response = self.session.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url, timeout=15)
             response.raise_for_status()
+            self.update_delays(response)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find campaign cards - the class names may vary
-            campaigns = soup.find_all('div', class_=re.compile('.*campaign.*|.*card.*|.*tile.*', re.IGNORECASE))
+            tree = LexborHTMLParser(response_html(response))
             
-            # Alternative: look for links containing /f/
-            if not campaigns:
-                campaign_links = soup.find_all('a', href=re.compile(r'/f/'))
-                campaigns = [link.find_parent('div') for link in campaign_links if link.find_parent('div')]
+            # Every campaign card links to its /f/ page
+            campaign_links = tree.css('a[href*="/f/"]')
             
             page_campaigns = []
+            seen_urls = set()
             
-            for campaign in campaigns:
-                campaign_data = self.extract_campaign_data(campaign)
-                if campaign_data and campaign_data.get('url'):
+            for link in campaign_links:
+                campaign_data = self.extract_campaign_data(link)
+                if campaign_data and campaign_data.get('url') and campaign_data['url'] not in seen_urls:
+                    seen_urls.add(campaign_data['url'])
                     page_campaigns.append(campaign_data)
             
             print(f"Found {len(page_campaigns)} campaigns on page {page_num}")
@@ -178,10 +299,12 @@ class GoFundMeScraper:
         print(f"Starting scrape for up to {max_campaigns} campaigns...")
         print("=" * 60)
         
+        # First pass: discover campaigns from the category pages
         page = 1
-        total_scraped = 0
+        discovered = []
+        seen_urls = set()
         
-        while total_scraped < max_campaigns and page <= max_pages:
+        while len(discovered) < max_campaigns and page <= max_pages:
             # Scrape category page
             page_campaigns = self.scrape_category_page(page)
             
@@ -189,21 +312,34 @@ class GoFundMeScraper:
                 print(f"No campaigns found on page {page}. Stopping.")
                 break
             
-            # Get detailed info for each campaign
             for campaign in page_campaigns:
-                if total_scraped >= max_campaigns:
-                    break
-                
-                details = self.get_campaign_details(campaign['url'])
+                if campaign['url'] not in seen_urls:
+                    seen_urls.add(campaign['url'])
+                    discovered.append(campaign)
+            
+            page += 1
+            if len(discovered) < max_campaigns and page <= max_pages:
+                self.random_delay(*self.page_delay)  # Longer delay between pages
+        
+        discovered = discovered[:max_campaigns]
+        
+        # Second pass: fetch detail pages concurrently, at most max_workers in flight
+        print(f"Fetching details for {len(discovered)} campaigns ({self.max_workers} workers)...")
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            details_list = executor.map(self.get_campaign_details, [c['url'] for c in discovered])
+            
+            for total_scraped, (campaign, details) in enumerate(zip(discovered, details_list), 1):
                 campaign.update(details)
-                
                 self.campaigns.append(campaign)
-                total_scraped += 1
+                self.write_campaign(campaign)
                 
-                print(f"[{total_scraped}/{max_campaigns}] Scraped: {campaign.get('title', 'Unknown')[:50]}")
-            
-            page += 1
-            self.random_delay(5, 10)  # Longer delay between pages
+                print(f"[{total_scraped}/{len(discovered)}] Scraped: {campaign.get('title', 'Unknown')[:50]}")
+        except KeyboardInterrupt:
+            print(f"\n⚠️  Interrupted! Keeping {len(self.campaigns)} campaigns already written")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.close_output()
         
         print("=" * 60)
         print(f"Scraping complete! Total campaigns: {len(self.campaigns)}")
@@ -215,11 +351,8 @@ class GoFundMeScraper:
             print("No campaigns to save!")
             return
         
-        keys = ['id', 'title', 'url', 'image_url', 'amount_raised', 
-                'description', 'created_date', 'days_running']
-        
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys, extrasaction='ignore')
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(self.campaigns)
         
@@ -253,11 +386,8 @@ def main():
     # Scrape campaigns (adjust max_campaigns as needed)
     campaigns = scraper.scrape_campaigns(max_campaigns=100)  # Start with 100 for testing
     
-    # Save results
+    # Results were written to CSV/JSONL as they were scraped
     if campaigns:
-        scraper.save_to_csv()
-        scraper.save_to_json()
-        
         # Print summary
         print("\n" + "=" * 60)
         print("SUMMARY")
@@ -265,7 +395,7 @@ def main():
         print(f"Total campaigns scraped: {len(campaigns)}")
         
         if campaigns:
-            total_raised = sum(int(c.get('amount_raised', 0)) for c in campaigns if c.get('amount_raised', '').isdigit())
+            total_raised = sum(c['amount_int'] for c in campaigns)
             print(f"Total amount raised: ${total_raised:,}")
             print(f"\nSample campaign:")
             sample = campaigns[0]
@@ -3,6 +3,8 @@ GoFundMe Scraper - FINAL WORKING VERSION
 - Clicks "Show more" button (not pagination)
 - Handles "hrs ago" format (returns 0 days)
 - Extracts: url, image_url, amount_raised, description, days_running
+- Chrome is only used for "Show more"; campaign pages are fetched over plain HTTP,
+  while URLs are still being collected
 """
 
 from selenium import webdriver
@@ -10,23 +12,77 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+import requests
 import time
 import json
 import csv
 import random
 import re
-from typing import List, Dict
-from datetime import datetime
+from typing import List, Dict, Set
+from datetime import date
+import calendar
+import os
+import shelve
+from http_utils import mount_retrying_adapter, response_html
+
+# Keep the downloaded chromedriver in the project so later runs skip the lookup
+os.environ.setdefault('WDM_LOCAL', '1')
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Page-parsing patterns
+_RE_DOLLAR = re.compile(r'\$(\d[\d,]*)')
+_RE_HRS = re.compile(r'\d+\s*hrs?\s+ago', re.IGNORECASE)
+_RE_DAYS = re.compile(r'(\d+)\s*d(?:ays?)?\s+ago', re.IGNORECASE)
+_RE_CREATED_DATE = re.compile(r'Created\s+([A-Za-z]+)\s+(\d+)(?:st|nd|rd|th)?,?\s+(\d{4})')
+
+CSV_FIELDS = ['url', 'image_url', 'amount_raised', 'description', 'days_running']
+
+# 'january' -> 1, ...
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
 
 class GoFundMeFinalScraper:
-    def __init__(self, headless=True):
+    # Reference date for "Month Day, Year" bylines, taken once per run
+    TODAY = date.today()
+    # Without the byline element, only the top of the page text is searched
+    DAYS_FALLBACK_CHARS = 2048
+    
+    def __init__(self, headless=True, cache_file='gofundme_details_cache', cache_expire_after=86400,
+                 csv_file='gofundme_campaigns_final.csv', jsonl_file='gofundme_campaigns_final.jsonl'):
+        self.base_url = "https://www.gofundme.com"
         self.campaign_urls = set()
         self.campaigns = []
         self.driver = None
         self.headless = headless
+        self.cache_file = cache_file
+        # Seconds before cached details are extracted again (amounts and days go stale)
+        self.cache_expire_after = cache_expire_after
+        self.details_cache = None
+        
+        # Campaigns are appended to these as they are extracted (None to disable)
+        self.csv_file = csv_file
+        self.jsonl_file = jsonl_file
+        self._csv_handle = None
+        self._csv_writer = None
+        self._jsonl_handle = None
+        
+        # Campaign pages are static HTML, so detail workers skip the browser
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        mount_retrying_adapter(self.session)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
         
     def setup_driver(self):
-        """Setup Chrome driver"""
+        """Setup Chrome driver (once; later calls reuse the running browser)"""
+        if self.driver:
+            return
+        
         chrome_options = Options()
         
         if self.headless:
@@ -35,13 +91,33 @@ class GoFundMeFinalScraper:
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        chrome_options.add_argument(f'user-agent={USER_AGENT}')
+        
+        # Only the DOM is needed, so don't download images
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.cookies': 1
+        })
         
         service = Service(ChromeDriverManager().install())
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         
+        # Also block fonts and media, which the prefs above don't cover. Stylesheets
+        # are kept so the 'Show more' button stays laid out and clickable.
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': ['*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif', '*.svg', '*.woff', '*.woff2', '*.ttf', '*.mp4']
+        })
+        
         print("✓ Chrome driver initialized")
     
+    def quit_driver(self):
+        """Close the browser if it is running"""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            print(f"\n✓ Browser closed")
+    
     def random_delay(self, min_seconds=2, max_seconds=4):
         time.sleep(random.uniform(min_seconds, max_seconds))
     
@@ -83,28 +159,36 @@ class GoFundMeFinalScraper:
         except Exception as e:
             return False
     
-    def extract_visible_urls(self) -> List[str]:
+    def extract_visible_urls(self) -> Set[str]:
         """Extract all currently visible campaign URLs"""
         try:
-            links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/f/"]')
+            # One script call returns every href (already absolute), instead of
+            # shipping the whole page source or querying each link through the driver
+            hrefs = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href*=\"/f/\"]')).map(a => a.href);"
+            )
             
-            urls = []
-            for link in links:
-                try:
-                    href = link.get_attribute('href')
-                    if href and '/f/' in href:
-                        clean_url = href.split('?')[0].rstrip('/')
-                        if clean_url not in urls:
-                            urls.append(clean_url)
-                except:
-                    continue
+            urls = set()
+            for href in hrefs or []:
+                if href and '/f/' in href:
+                    urls.add(urljoin(self.base_url, href.partition('?')[0]).rstrip('/'))
             
             return urls
         except:
-            return []
+            return set()
     
-    def collect_all_urls(self, max_campaigns=100):
-        """Collect URLs by clicking 'Show more' button"""
+    def collect_all_urls(self, max_campaigns=100, url_queue=None):
+        """
+        Collect URLs by clicking 'Show more' button
+        
+        Args:
+            max_campaigns: Number of URLs to collect
+            url_queue: Optional queue.Queue that receives each new URL as soon as it is seen
+        
+        Without url_queue the browser is closed once collection ends, since
+        extract_all_details fetches pages over HTTP; scrape_pipelined closes
+        it itself.
+        """
         print("\n" + "=" * 80)
         print(f"PHASE 1: Collecting {max_campaigns} URLs via 'Show more' button")
         print("=" * 80)
@@ -114,60 +198,61 @@ class GoFundMeFinalScraper:
         url = "https://www.gofundme.com/discover/animal-fundraiser"
         print(f"\nLoading: {url}\n")
         
-        try:
-            self.driver.get(url)
-            time.sleep(4)
-            
-            # Initial scroll
-            for i in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-            
-            attempts = 0
-            no_new_count = 0
+        self.driver.get(url)
+        time.sleep(2)  # Quicker to settle without images and fonts
+        
+        # Initial scroll
+        for i in range(3):
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(1)
+        
+        attempts = 0
+        no_new_count = 0
+        
+        while len(self.campaign_urls) < max_campaigns and attempts <= 100 and not self._stop.is_set():
+            # Get visible URLs
+            visible_urls = self.extract_visible_urls()
+            new_urls = visible_urls - self.campaign_urls
             
-            while len(self.campaign_urls) < max_campaigns and attempts <= 100:
-                # Get visible URLs
-                visible_urls = self.extract_visible_urls()
-                new_urls = [u for u in visible_urls if u not in self.campaign_urls]
-                
-                if new_urls:
-                    print(f"[Attempt {attempts + 1}]")
-                    print(f"  Visible: {len(visible_urls)} | New: {len(new_urls)} | Total: {len(self.campaign_urls) + len(new_urls)}")
-                    
-                    # Add new URLs
-                    for u in new_urls:
-                        self.campaign_urls.add(u)
-                    
-                    no_new_count = 0
-                else:
-                    no_new_count += 1
-                    print(f"[Attempt {attempts + 1}] No new URLs (strike {no_new_count}/3)")
-                
-                # Stop conditions
-                if len(self.campaign_urls) >= max_campaigns:
-                    print(f"\n✓ Reached {max_campaigns} URLs!")
-                    break
+            if new_urls:
+                print(f"[Attempt {attempts + 1}]")
+                print(f"  Visible: {len(visible_urls)} | New: {len(new_urls)} | Total: {len(self.campaign_urls) + len(new_urls)}")
                 
-                if no_new_count >= 3:
-                    print(f"\n✗ No new URLs for 3 attempts")
-                    break
+                # Hand new URLs to the detail workers right away
+                if url_queue is not None:
+                    for u in list(new_urls)[:max(0, max_campaigns - len(self.campaign_urls))]:
+                        url_queue.put(u)
                 
-                # Click "Show more"
-                if not self.click_show_more():
-                    print("    ✗ 'Show more' button not found")
-                    # Try scrolling anyway
-                    for i in range(3):
-                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(1)
+                # Add new URLs
+                self.campaign_urls.update(new_urls)
                 
-                attempts += 1
-                time.sleep(3)  # Wait for content to load
+                no_new_count = 0
+            else:
+                no_new_count += 1
+                print(f"[Attempt {attempts + 1}] No new URLs (strike {no_new_count}/3)")
             
-        finally:
-            if self.driver:
-                self.driver.quit()
-                print(f"\n✓ Browser closed")
+            # Stop conditions
+            if len(self.campaign_urls) >= max_campaigns:
+                print(f"\n✓ Reached {max_campaigns} URLs!")
+                break
+            
+            if no_new_count >= 3:
+                print(f"\n✗ No new URLs for 3 attempts")
+                break
+            
+            # Click "Show more"
+            if not self.click_show_more():
+                print("    ✗ 'Show more' button not found")
+                # Try scrolling anyway
+                for i in range(3):
+                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    time.sleep(1)
+            
+            attempts += 1
+            time.sleep(3)  # Wait for content to load
+        
+        if url_queue is None:
+            self.quit_driver()
         
         urls_list = list(self.campaign_urls)[:max_campaigns]
         print(f"\n{'=' * 80}")
@@ -178,40 +263,38 @@ class GoFundMeFinalScraper:
     
     # ========== PHASE 2: EXTRACT DETAILS ==========
     
-    def extract_days_running(self) -> str:
+    def extract_days_running(self, tree, page_text: str) -> str:
         """Extract days - handles 'X d ago', 'X hrs ago', and 'Month Day, Year'"""
         try:
             # Find created element
-            try:
-                elem = self.driver.find_element(By.CSS_SELECTOR, 'span.m-campaign-byline-created')
-                text = elem.text.strip()
-            except:
+            elem = tree.css_first('span.m-campaign-byline-created')
+            if elem:
+                text = elem.text(separator=' ', strip=True)
+            else:
                 # Fallback to page text
-                text = self.driver.find_element(By.TAG_NAME, 'body').text
+                text = page_text[:self.DAYS_FALLBACK_CHARS]
             
             # Pattern 1: "X hrs ago" → 0 days
-            if re.search(r'(\d+)\s*hrs?\s+ago', text, re.IGNORECASE):
+            if _RE_HRS.search(text):
                 return '0'
             
             # Pattern 2: "X d ago" → extract number
-            days_match = re.search(r'(\d+)\s*d(?:ays?)?\s+ago', text, re.IGNORECASE)
+            days_match = _RE_DAYS.search(text)
             if days_match:
                 return days_match.group(1)
             
             # Pattern 3: "Month Day, Year" → calculate
-            date_match = re.search(r'Created\s+([A-Za-z]+)\s+(\d+)(?:st|nd|rd|th)?,?\s+(\d{4})', text)
+            date_match = _RE_CREATED_DATE.search(text)
             if date_match:
-                month_name = date_match.group(1)
-                day = date_match.group(2)
-                year = date_match.group(3)
+                month = _MONTHS.get(date_match.group(1).lower())
+                day = int(date_match.group(2))
+                year = int(date_match.group(3))
                 
                 try:
-                    date_str = f"{month_name} {day}, {year}"
-                    created_date = datetime.strptime(date_str, "%B %d, %Y")
-                    today = datetime(2025, 10, 26)
-                    days_diff = (today - created_date).days
+                    created_date = date(year, month, day)
+                    days_diff = (self.TODAY - created_date).days
                     return str(days_diff) if days_diff >= 0 else 'Unknown'
-                except:
+                except (TypeError, ValueError):
                     pass
             
             return 'Unknown'
@@ -219,80 +302,100 @@ class GoFundMeFinalScraper:
         except:
             return 'Unknown'
     
-    def extract_campaign_details(self, url: str, index: int, total: int) -> Dict:
-        """Extract details from individual campaign page"""
-        try:
-            campaign_id = url.split('/f/')[-1]
-            print(f"  [{index}/{total}] {campaign_id[:40]}...", end=" ", flush=True)
-            
-            self.driver.get(url)
-            time.sleep(2.5)
-            
-            data = {'url': url}
-            
-            page_text = self.driver.find_element(By.TAG_NAME, 'body').text
-            
-            # 1. IMAGE URL
-            try:
-                img_meta = self.driver.find_element(By.CSS_SELECTOR, 'meta[property="og:image"]')
-                data['image_url'] = img_meta.get_attribute('content')
-            except:
-                data['image_url'] = ''
-            
-            # 2. AMOUNT RAISED
-            try:
-                amounts = re.findall(r'\$[\d,]+', page_text)
-                if amounts:
-                    amounts_numeric = [int(a.replace('$', '').replace(',', '')) for a in amounts]
-                    data['amount_raised'] = str(max(amounts_numeric))
-                else:
-                    data['amount_raised'] = '0'
-            except:
-                data['amount_raised'] = '0'
-            
-            # 3. DESCRIPTION
-            try:
-                desc_selectors = [
-                    'div[class*="o-campaign-description"]',
-                    'div[class*="campaign-description"]',
-                    'meta[property="og:description"]'
-                ]
-                
-                description = ''
-                for selector in desc_selectors:
-                    try:
-                        if 'meta' in selector:
-                            elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            description = elem.get_attribute('content')
-                        else:
-                            elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                            description = elem.text.strip()
-                        
-                        if description and len(description) > 20:
-                            break
-                    except:
-                        continue
-                
-                data['description'] = description[:500] if description else ''
-            except:
-                data['description'] = ''
-            
-            # 4. DAYS RUNNING
-            data['days_running'] = self.extract_days_running()
-            
-            print(f"${data['amount_raised']} | {data['days_running']} days")
-            
+    def parse_campaign_page(self, url: str, html: str) -> Dict:
+        """Extract all detail fields from a campaign page's HTML in one parse"""
+        tree = LexborHTMLParser(html)
+        data = {'url': url}
+        
+        # 1. IMAGE URL
+        img_meta = tree.css_first('meta[property="og:image"]')
+        data['image_url'] = (img_meta.attributes.get('content') or '') if img_meta else ''
+        
+        og_description = tree.css_first('meta[property="og:description"]')
+        
+        # Visible text only, whitespace-collapsed like the rendered body text,
+        # so source indentation doesn't eat the DAYS_FALLBACK_CHARS window
+        tree.strip_tags(['script', 'style', 'noscript'])
+        page_text = ' '.join(tree.body.text(separator=' ', strip=True).split()) if tree.body else ''
+        
+        # 2. AMOUNT RAISED
+        data['amount_int'] = max((int(a.replace(',', '')) for a in _RE_DOLLAR.findall(page_text)), default=0)
+        data['amount_raised'] = str(data['amount_int'])
+        
+        # 3. DESCRIPTION
+        description = ''
+        for selector in ['div[class*="o-campaign-description"]', 'div[class*="campaign-description"]']:
+            elem = tree.css_first(selector)
+            if elem:
+                description = elem.text(separator=' ', strip=True)
+                if len(description) > 20:
+                    break
+        
+        if len(description) <= 20 and og_description:
+            description = og_description.attributes.get('content') or description
+        
+        data['description'] = description[:500] if description else ''
+        
+        # 4. DAYS RUNNING
+        data['days_running'] = self.extract_days_running(tree, page_text)
+        
+        return data
+    
+    def get_cached_details(self, url: str):
+        """Return previously extracted details for url, or None if missing or expired"""
+        with self._lock:
+            if self.details_cache is None or url not in self.details_cache:
+                return None
+            entry = self.details_cache[url]
+        
+        # Entries are (time stored, details); anything else predates the expiry
+        if not isinstance(entry, tuple) or time.time() - entry[0] > self.cache_expire_after:
+            return None
+        return entry[1]
+    
+    def cache_details(self, url: str, data: Dict):
+        """Remember extracted details for url, stamped with the time"""
+        with self._lock:
+            if self.details_cache is not None:
+                self.details_cache[url] = (time.time(), data)
+    
+    def open_details_cache(self):
+        """Open the on-disk details cache, if enabled"""
+        if self.cache_file and self.details_cache is None:
+            # Details already extracted by an earlier (possibly interrupted) run are reused
+            self.details_cache = shelve.open(self.cache_file)
+    
+    def close_details_cache(self):
+        """Flush and close the on-disk details cache"""
+        if self.details_cache is not None:
+            self.details_cache.close()
+            self.details_cache = None
+    
+    def fetch_campaign_details(self, url: str) -> Dict:
+        """Extract details from a campaign page fetched over HTTP (no browser)"""
+        data = self.get_cached_details(url)
+        if data is not None:
             return data
-            
+        
+        self.random_delay(2, 4)
+        
+        try:
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            data = self.parse_campaign_page(url, response_html(response))
         except Exception as e:
-            print(f"Error: {str(e)[:30]}")
+            print(f"  Error fetching {url.split('/f/')[-1][:40]}: {str(e)[:30]}")
             return {
                 'url': url,
                 'image_url': '',
                 'amount_raised': '0',
+                'amount_int': 0,
                 'description': '',
                 'days_running': 'Unknown'
             }
+        
+        self.cache_details(url, data)
+        return data
     
     def extract_all_details(self, urls: List[str]):
         """Extract details from all URLs"""
@@ -301,39 +404,125 @@ class GoFundMeFinalScraper:
         print("=" * 80)
         print("Fields: url, image_url, amount_raised, description, days_running\n")
         
-        self.setup_driver()
+        self.open_details_cache()
+        self.open_output()
         
         try:
             for i, url in enumerate(urls, 1):
-                campaign_data = self.extract_campaign_details(url, i, len(urls))
+                campaign_data = self.fetch_campaign_details(url)
                 self.campaigns.append(campaign_data)
+                self.write_campaign(campaign_data)
+                
+                print(f"  [{i}/{len(urls)}] {url.split('/f/')[-1][:40]}... ${campaign_data['amount_raised']} | {campaign_data['days_running']} days")
                 
                 if i % 25 == 0:
                     with_days = sum(1 for c in self.campaigns if c.get('days_running') != 'Unknown')
                     print(f"\n  Progress: {i}/{len(urls)} | Days: {with_days}/{i} ({with_days/i*100:.0f}%)\n")
                 
-                self.random_delay(2, 4)
-                
         except KeyboardInterrupt:
             print(f"\n\n⚠️  Interrupted! Saving {len(self.campaigns)} campaigns...")
         finally:
-            if self.driver:
-                self.driver.quit()
+            self.close_details_cache()
+            self.close_output()
         
         print("\n" + "=" * 80)
         print(f"✓ Phase 2: Extracted {len(self.campaigns)} campaigns")
         print("=" * 80)
     
+    # ========== PIPELINED: COLLECT AND EXTRACT TOGETHER ==========
+    
+    def detail_worker(self, url_queue: queue.Queue, max_campaigns: int):
+        """Consume URLs from the queue until a None sentinel arrives"""
+        while True:
+            url = url_queue.get()
+            if url is None or self._stop.is_set():
+                return
+            
+            campaign_data = self.fetch_campaign_details(url)
+            
+            with self._lock:
+                self.campaigns.append(campaign_data)
+                self.write_campaign(campaign_data)
+                done = len(self.campaigns)
+            
+            print(f"  [{done}/{max_campaigns}] {url.split('/f/')[-1][:40]}... ${campaign_data['amount_raised']} | {campaign_data['days_running']} days")
+    
+    def scrape_pipelined(self, max_campaigns=100, workers=16):
+        """Collect URLs with 'Show more' while a pool of HTTP workers extracts details"""
+        print("\n" + "=" * 80)
+        print(f"Collecting {max_campaigns} URLs and extracting details with {workers} workers")
+        print("=" * 80)
+        
+        url_queue = queue.Queue()
+        self.open_details_cache()
+        self.open_output()
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for _ in range(workers):
+                executor.submit(self.detail_worker, url_queue, max_campaigns)
+            
+            try:
+                # The browser loop runs here and feeds the workers as it goes
+                self.collect_all_urls(max_campaigns=max_campaigns, url_queue=url_queue)
+            finally:
+                self.quit_driver()
+                for _ in range(workers):
+                    url_queue.put(None)
+            
+            # Wait for the workers to drain the queue
+            executor.shutdown(wait=True)
+        except KeyboardInterrupt:
+            print(f"\n\n⚠️  Interrupted! Saving {len(self.campaigns)} campaigns...")
+            self._stop.set()
+            for _ in range(workers):
+                url_queue.put(None)
+            # Workers finish their current page and exit before outputs close
+            executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            self.close_details_cache()
+            self.close_output()
+        
+        print("\n" + "=" * 80)
+        print(f"✓ Extracted {len(self.campaigns)} campaigns")
+        print("=" * 80)
+    
     # ========== SAVE ==========
     
+    def open_output(self):
+        """Create the streamed output files and write the CSV header"""
+        if self.csv_file:
+            self._csv_handle = open(self.csv_file, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.DictWriter(self._csv_handle, fieldnames=CSV_FIELDS, extrasaction='ignore')
+            self._csv_writer.writeheader()
+        if self.jsonl_file:
+            self._jsonl_handle = open(self.jsonl_file, 'w', encoding='utf-8')
+    
+    def write_campaign(self, campaign: Dict):
+        """Append one campaign to the open output files (a no-op after close_output)"""
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(campaign)
+            self._csv_handle.flush()
+        
+        if self._jsonl_handle is not None:
+            self._jsonl_handle.write(json.dumps(campaign, ensure_ascii=False) + '\n')
+            self._jsonl_handle.flush()
+    
+    def close_output(self):
+        """Close the streamed output files"""
+        with self._lock:
+            for handle in (self._csv_handle, self._jsonl_handle):
+                if handle:
+                    handle.close()
+                    print(f"✓ Saved to {handle.name}")
+            self._csv_handle = self._csv_writer = self._jsonl_handle = None
+    
     def save_to_csv(self, filename='gofundme_campaigns_final.csv'):
         if not self.campaigns:
             return
         
-        keys = ['url', 'image_url', 'amount_raised', 'description', 'days_running']
-        
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(self.campaigns)
         
@@ -361,6 +550,7 @@ def main():
     # Configuration
     MAX_CAMPAIGNS = 1100
     HEADLESS = True
+    WORKERS = 16  # Concurrent campaign page fetches
     
     print(f"Configuration:")
     print(f"  Target: {MAX_CAMPAIGNS} campaigns")
@@ -369,21 +559,14 @@ def main():
     
     scraper = GoFundMeFinalScraper(headless=HEADLESS)
     
-    # PHASE 1: Click "Show more" to collect URLs
-    urls = scraper.collect_all_urls(max_campaigns=MAX_CAMPAIGNS)
+    try:
+        # Click "Show more" to collect URLs while workers extract details
+        scraper.scrape_pipelined(max_campaigns=MAX_CAMPAIGNS, workers=WORKERS)
+    finally:
+        scraper.quit_driver()
     
-    if not urls:
-        print("\n✗ No URLs collected")
-        return
-    
-    # PHASE 2: Extract details
-    scraper.extract_all_details(urls)
-    
-    # Save
+    # Campaigns were already streamed to CSV/JSONL while scraping
     if scraper.campaigns:
-        scraper.save_to_csv()
-        scraper.save_to_json()
-        
         print("\n" + "=" * 80)
         print("SUCCESS!")
         print("=" * 80)
@@ -396,7 +579,7 @@ def main():
             print(f"    {c['url'].split('/f/')[-1][:50]}")
         
         # Stats
-        total = sum(int(c['amount_raised']) for c in scraper.campaigns if c['amount_raised'].isdigit())
+        total = sum(c['amount_int'] for c in scraper.campaigns)
         with_days = sum(1 for c in scraper.campaigns if c['days_running'] != 'Unknown')
         with_desc = sum(1 for c in scraper.campaigns if c['description'])
         
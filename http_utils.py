@@ -0,0 +1,27 @@
+"""
+HTTP helpers shared by the GoFundMe scrapers
+"""
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def mount_retrying_adapter(session, pool_maxsize=32):
+    """Mount a keep-alive pool on session that backs off on 429/5xx, honouring Retry-After"""
+    # All requests go to www.gofundme.com, so one pool sized for the concurrent fetches
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                          respect_retry_after_header=True)
+    )
+    session.mount('https://', adapter)
+
+
+def response_html(response) -> str:
+    """Decoded page HTML, without falling back to charset sniffing"""
+    # With no charset in Content-Type, requests guesses (ISO-8859-1 or a full
+    # chardet scan of the body); GoFundMe serves UTF-8, so say so up front
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = 'utf-8'
+    return response.text
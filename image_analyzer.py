@@ -7,13 +7,30 @@ import json
 import csv
 import time
 import os
-from typing import List, Dict, Optional
+import sys
+import logging
+import threading
+import hashlib
+import functools
+import operator
+from collections import Counter
+from itertools import islice
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
 # Google Cloud Vision
 try:
     from google.cloud import vision
+    from google.api_core import retry as api_retry
+    from google.api_core.exceptions import (
+        ResourceExhausted, ServiceUnavailable, InternalServerError, DeadlineExceeded
+    )
     GOOGLE_AVAILABLE = True
 except ImportError:
     GOOGLE_AVAILABLE = False
@@ -29,11 +46,192 @@ except ImportError:
     AZURE_AVAILABLE = False
     print("Azure Computer Vision not installed. Install with: pip install azure-cognitiveservices-vision-computervision")
 
+# Pillow, for downscaling images before upload
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    print("Pillow not installed, images will be sent by URL at full size. Install with: pip install Pillow")
+
+# diskcache, for keeping prepared images across runs
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    print("diskcache not installed, nothing will be cached between runs. Install with: pip install diskcache")
+
+# tqdm, for the progress bar
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+    print("tqdm not installed, no progress bar will be shown. Install with: pip install tqdm")
+
+# orjson, for faster result serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("orjson not installed, falling back to the json module. Install with: pip install orjson")
+
+# pyarrow, for fast CSV loading
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    print("pyarrow not installed, CSV input will be read with the csv module. Install with: pip install pyarrow")
+
+logger = logging.getLogger(__name__)
+
+# Campaign columns the analyzer reads from CSV input
+INPUT_CSV_FIELDS = ['url', 'image_url', 'title', 'amount_raised', 'days_running', 'description']
+
+# Flattened CSV columns; Azure runs add the caption columns
+CSV_FIELDS = ['url', 'image_url', 'amount_raised', 'days_running', 'description', 'all_labels']
+AZURE_CSV_FIELDS = ['image_caption', 'caption_confidence']
+
+
+def chunked(items: List, size: int):
+    """Yield consecutive slices of at most size items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` acquisitions per `period` seconds"""
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.period)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.period / self.rate
+            time.sleep(wait)
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(data):
+    """Parse JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vision_client():
+    """Process-wide Vision client, so every analyzer and thread shares one gRPC channel"""
+    return vision.ImageAnnotatorClient(transport='grpc')
+
+
+# Campaign values copied verbatim into each CSV row, in CampaignRow field order
+_ROW_KEYS = ('url', 'image_url', 'amount_raised', 'days_running', 'description')
+_row_values = operator.itemgetter(*_ROW_KEYS)
+
+
+@dataclass(slots=True)
+class CampaignRow:
+    """One flattened CSV row: campaign fields plus its image labels, all as strings"""
+    url: str = ''
+    image_url: str = ''
+    amount_raised: str = ''
+    days_running: str = ''
+    description: str = ''
+    all_labels: str = ''
+    image_caption: str = ''
+    caption_confidence: str = ''
+    
+    @classmethod
+    def from_analysis(cls, campaign: Dict, analysis: Optional[Dict]) -> 'CampaignRow':
+        """Build the row for a campaign and its (possibly missing) analysis"""
+        analysis = analysis or {}
+        captions = analysis.get('captions') or []
+        try:
+            values = _row_values(campaign)
+        except KeyError:
+            values = [campaign.get(key, '') for key in _ROW_KEYS]
+        # None becomes an empty cell, as csv.DictWriter writes it
+        url, image_url, amount_raised, days_running, description = (
+            '' if value is None else str(value) for value in values
+        )
+        return cls(
+            url=url,
+            image_url=image_url,
+            amount_raised=amount_raised,
+            days_running=days_running,
+            description=description,
+            all_labels=', '.join(analysis.get('top_labels', [])),
+            image_caption=captions[0]['text'] if captions else '',
+            caption_confidence=str(captions[0]['confidence']) if captions else '',
+        )
+    
+    def values(self, fields: List[str]) -> List[str]:
+        """Column values in the order of fields"""
+        return [getattr(self, name) for name in fields]
+
 
 class ImageAnalyzer:
     """Analyze images using Google Vision or Azure Computer Vision"""
     
-    def __init__(self, service='google', credentials=None):
+    # Google Vision accepts at most 16 images per batch_annotate_images call
+    BATCH_SIZE = 16
+    
+    # Image budget: longest edge in pixels and JPEG quality of what is uploaded.
+    # Labels only need coarse features, so a thumbnail is enough.
+    MAX_IMAGE_EDGE = 1024
+    JPEG_QUALITY = 85
+    
+    # What a HEAD precheck accepts before an image is sent to Vision;
+    # 20 MB is Vision's hard limit on image file size
+    PRECHECK_TYPES = {'image/jpeg', 'image/png', 'image/webp'}
+    MAX_IMAGE_BYTES = 20 * 1024 * 1024
+    
+    # Gap between the first max_concurrency batch submissions, so workers
+    # don't all download, upload and parse in lockstep
+    STAGGER_SECONDS = 0.05
+    
+    # Backoff for transient Vision errors: seconds of the first wait, the cap
+    # on any single wait, and the total time spent retrying one call
+    RETRY_INITIAL = 1.0
+    RETRY_MAXIMUM = 32.0
+    RETRY_DEADLINE = 120.0
+    
+    # Vision features that can be requested: Feature.Type name -> max_results
+    FEATURES = {
+        'LABEL_DETECTION': 10,
+        'TEXT_DETECTION': None,
+        'IMAGE_PROPERTIES': None,
+        'SAFE_SEARCH_DETECTION': None,
+    }
+    
+    # Only labels end up in the CSV, so that is all we pay for by default
+    DEFAULT_FEATURES = ['LABEL_DETECTION']
+    
+    def __init__(self, service='google', credentials=None, cache_dir='.vision_cache',
+                 features: Optional[List[str]] = None):
         """
         Initialize the image analyzer
         
@@ -42,11 +240,53 @@ class ImageAnalyzer:
             credentials: dict with API credentials
                 For Google: {'credentials_path': 'path/to/key.json'}
                 For Azure: {'subscription_key': 'your_key', 'endpoint': 'your_endpoint'}
+            cache_dir: Directory for the on-disk caches (None disables caching)
+            features: Vision feature names to request (keys of FEATURES),
+                defaults to DEFAULT_FEATURES
         """
         self.service = service.lower()
+        self.features = list(features or self.DEFAULT_FEATURES)
+        unknown = [name for name in self.features if name not in self.FEATURES]
+        if unknown:
+            raise ValueError(f"Unknown Vision features: {', '.join(unknown)}")
+        
+        # Which extraction blocks _parse_response runs, decided once here
+        self._want_labels = 'LABEL_DETECTION' in self.features
+        self._want_text = 'TEXT_DETECTION' in self.features
+        self._want_colors = 'IMAGE_PROPERTIES' in self.features
+        self._want_safe_search = 'SAFE_SEARCH_DETECTION' in self.features
         self.credentials = credentials or {}
         self.client = None
-        self.results = []
+        # JSON Lines file the last process_campaigns run streamed its results to
+        self.results_file = None
+        self._results_handle = None
+        self._csv_handle = None
+        self._csv_writer = None
+        self._progress = None
+        # Index of the next campaign to be written, so outputs keep input order
+        self._next_write = 0
+        # How many successfully analyzed images carried each label in the last run
+        self.label_counts = Counter()
+        
+        # One pooled session for image downloads, shared by all workers
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        
+        self.image_cache = None
+        self.result_cache = None
+        if cache_dir and DISKCACHE_AVAILABLE:
+            self.image_cache = diskcache.Cache(os.path.join(cache_dir, 'images'))
+            self.result_cache = diskcache.Cache(os.path.join(cache_dir, 'results'))
+        
+        # Cached analyses are only valid for the same features and image budget
+        self.cache_version = hashlib.sha1(
+            repr((self.service, sorted(self.features), self.MAX_IMAGE_EDGE, self.JPEG_QUALITY)).encode('utf-8')
+        ).hexdigest()[:12]
         
         self._setup_google()
  
@@ -60,29 +300,119 @@ class ImageAnalyzer:
         if 'credentials_path' in self.credentials:
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = self.credentials['credentials_path']
         
-        self.client = vision.ImageAnnotatorClient()
-        print("✓ Google Vision API initialized")
+        # The client is thread-safe; HTTP/2 multiplexes concurrent calls on its channel
+        self.client = _get_vision_client()
+        
+        # Feature protos are the same for every request, so build them once
+        self._feature_protos = []
+        for name in self.features:
+            feature = vision.Feature(type_=vision.Feature.Type[name])
+            if self.FEATURES[name]:
+                feature.max_results = self.FEATURES[name]
+            self._feature_protos.append(feature)
+        
+        # Exponential backoff with jitter on quota and availability errors;
+        # anything still failing after RETRY_DEADLINE becomes an error result
+        self.retry = api_retry.Retry(
+            predicate=api_retry.if_exception_type(
+                ResourceExhausted, ServiceUnavailable, InternalServerError, DeadlineExceeded
+            ),
+            initial=self.RETRY_INITIAL,
+            maximum=self.RETRY_MAXIMUM,
+            multiplier=2.0,
+            timeout=self.RETRY_DEADLINE,
+        )
+        logger.info("✓ Google Vision API initialized")
     
 
     
-    def analyze_image_google(self, image_url: str) -> Dict:
-        """Analyze image using Google Vision API"""
+    def _prepare_key(self, image_url: str) -> str:
+        """image_cache key of the prepared JPEG for an image URL at the current image budget"""
+        budget = f'{self.MAX_IMAGE_EDGE}:{self.JPEG_QUALITY}:'
+        return 'prepared:' + hashlib.sha1((budget + image_url).encode('utf-8')).hexdigest()
+    
+    def _precheck(self, image_url: str) -> bool:
+        """
+        HEAD the image and check it is something Vision can use
+        
+        Rejects non-200 responses, content types outside PRECHECK_TYPES and
+        files over MAX_IMAGE_BYTES. Hosts that don't allow HEAD (405) pass,
+        as do images already prepared in the cache.
+        """
+        if self.image_cache is not None and self._prepare_key(image_url) in self.image_cache:
+            return True
+        
         try:
-            image = vision.Image()
-            image.source.image_uri = image_url
+            head = self._http.head(image_url, allow_redirects=True, timeout=3)
+        except requests.RequestException as e:
+            logger.debug("Precheck failed for %s: %s", image_url, e)
+            return False
+        
+        if head.status_code == 405:
+            return True
+        if head.status_code != 200:
+            return False
+        
+        content_type = head.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type not in self.PRECHECK_TYPES:
+            return False
+        
+        length = head.headers.get('Content-Length', '')
+        return not (length.isdigit() and int(length) > self.MAX_IMAGE_BYTES)
+    
+    def _prepare_image(self, image_url: str) -> Optional[bytes]:
+        """
+        Download an image and re-encode it as a JPEG within the image budget
+        
+        Returns None if Pillow is missing or the image can't be fetched/decoded,
+        in which case Vision is given the URL instead.
+        """
+        if not PIL_AVAILABLE:
+            return None
+        
+        key = self._prepare_key(image_url)
+        if self.image_cache is not None:
+            cached = self.image_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        try:
+            response = self._http.get(image_url, timeout=(3, 10))
+            response.raise_for_status()
             
-            # Perform multiple detections
-            response = self.client.annotate_image({
-                'image': image,
-                'features': [
-                    {'type_': vision.Feature.Type.LABEL_DETECTION, 'max_results': 10},
-                    {'type_': vision.Feature.Type.TEXT_DETECTION},
-                    {'type_': vision.Feature.Type.IMAGE_PROPERTIES},
-                    {'type_': vision.Feature.Type.SAFE_SEARCH_DETECTION},
-                ]
-            })
+            img = Image.open(BytesIO(response.content))
+            img.thumbnail((self.MAX_IMAGE_EDGE, self.MAX_IMAGE_EDGE))
             
-            # Extract labels
+            buffer = BytesIO()
+            img.convert('RGB').save(buffer, format='JPEG', quality=self.JPEG_QUALITY)
+            jpeg_bytes = buffer.getvalue()
+        except Exception as e:
+            logger.debug("Could not prepare image, sending URL instead: %s", e)
+            return None
+        
+        if self.image_cache is not None:
+            self.image_cache.set(key, jpeg_bytes)
+        return jpeg_bytes
+    
+    def _build_request(self, image_url: str):
+        """Build the AnnotateImageRequest for one image URL"""
+        image = vision.Image()
+        jpeg_bytes = self._prepare_image(image_url)
+        if jpeg_bytes:
+            image.content = jpeg_bytes
+        else:
+            image.source.image_uri = image_url
+        
+        return vision.AnnotateImageRequest(image=image, features=self._feature_protos)
+    
+    def _parse_response(self, response) -> Dict:
+        """Turn one AnnotateImageResponse into the analysis dict"""
+        if response.error.message:
+            return self._error_result(response.error.message)
+        
+        # Extract labels
+        labels = []
+        if self._want_labels:
             labels = [
                 {
                     'description': label.description,
@@ -91,64 +421,106 @@ class ImageAnalyzer:
                 }
                 for label in response.label_annotations
             ]
-            
-            # Extract text (OCR)
-            texts = []
-            if response.text_annotations:
-                # First annotation contains full text
-                full_text = response.text_annotations[0].description if response.text_annotations else ""
-                texts = [text.description for text in response.text_annotations[1:]]  # Individual words
-            else:
-                full_text = ""
-            
-            # Extract dominant colors
-            colors = []
-            if response.image_properties_annotation:
-                colors = [
-                    {
-                        'color': f"RGB({int(c.color.red)}, {int(c.color.green)}, {int(c.color.blue)})",
-                        'score': round(c.score, 4),
-                        'pixel_fraction': round(c.pixel_fraction, 4)
-                    }
-                    for c in response.image_properties_annotation.dominant_colors.colors[:5]
-                ]
-            
-            # Safe search detection
-            safe_search = None
-            if response.safe_search_annotation:
-                safe = response.safe_search_annotation
-                safe_search = {
-                    'adult': safe.adult.name,
-                    'violence': safe.violence.name,
-                    'racy': safe.racy.name
+        
+        # Extract text (OCR)
+        texts = []
+        if self._want_text and response.text_annotations:
+            # First annotation contains full text
+            full_text = response.text_annotations[0].description
+            # Individual words, first 10 only, without copying the rest
+            texts = [text.description for text in islice(response.text_annotations, 1, 11)]
+        else:
+            full_text = ""
+        
+        # Extract dominant colors
+        colors = []
+        if self._want_colors and response.image_properties_annotation:
+            colors = [
+                {
+                    'color': f"RGB({int(c.color.red)}, {int(c.color.green)}, {int(c.color.blue)})",
+                    'score': round(c.score, 4),
+                    'pixel_fraction': round(c.pixel_fraction, 4)
                 }
-            
-            return {
-                'success': True,
-                'labels': labels,
-                'top_labels': [l['description'] for l in labels[:10]],
-                'full_text': full_text,
-                'text_snippets': texts[:10],  # First 10 words
-                'dominant_colors': colors,
-                'safe_search': safe_search,
-                'error': None
+                for c in response.image_properties_annotation.dominant_colors.colors[:5]
+            ]
+        
+        # Safe search detection
+        safe_search = None
+        if self._want_safe_search and response.safe_search_annotation:
+            safe = response.safe_search_annotation
+            safe_search = {
+                'adult': safe.adult.name,
+                'violence': safe.violence.name,
+                'racy': safe.racy.name
             }
+        
+        return {
+            'success': True,
+            'labels': labels,
+            'top_labels': [l['description'] for l in labels[:10]],
+            'full_text': full_text,
+            'text_snippets': texts,  # First 10 words
+            'dominant_colors': colors,
+            'safe_search': safe_search,
+            'error': None
+        }
+    
+    def _error_result(self, error: str) -> Dict:
+        """Analysis dict for an image that could not be analyzed"""
+        return {
+            'success': False,
+            'labels': [],
+            'top_labels': [],
+            'full_text': '',
+            'text_snippets': [],
+            'dominant_colors': [],
+            'safe_search': None,
+            'error': error
+        }
+    
+    def analyze_image_google(self, image_url: str) -> Dict:
+        """Analyze image using Google Vision API"""
+        try:
+            response = self.client.annotate_image(self._build_request(image_url), retry=self.retry)
+            return self._parse_response(response)
             
         except Exception as e:
-            print(f"Error analyzing image with Google: {e}")
-            return {
-                'success': False,
-                'labels': [],
-                'top_labels': [],
-                'full_text': '',
-                'text_snippets': [],
-                'dominant_colors': [],
-                'safe_search': None,
-                'error': str(e)
-            }
+            logger.warning("Error analyzing image with Google: %s", e)
+            return self._error_result(str(e))
     
- 
-            
+    def analyze_images_google_batch(self, image_urls: List[str]) -> List[Dict]:
+        """
+        Analyze several images with one batch_annotate_images call per BATCH_SIZE URLs
+        
+        Returns one analysis dict per URL, in the same order
+        """
+        results = []
+        for chunk in chunked(image_urls, self.BATCH_SIZE):
+            try:
+                batch = self.client.batch_annotate_images(
+                    requests=[self._build_request(url) for url in chunk],
+                    retry=self.retry,
+                )
+                results.extend(self._parse_response(response) for response in batch.responses)
+            except Exception as e:
+                logger.warning("Error analyzing image batch with Google: %s", e)
+                results.extend(self._error_result(str(e)) for _ in chunk)
+        
+        return results
+    
+    def _cached_analysis(self, image_url: str) -> Optional[Dict]:
+        """Previously stored successful analysis for this URL, or None"""
+        if self.result_cache is None:
+            return None
+        key = hashlib.sha1((self.cache_version + image_url).encode('utf-8')).hexdigest()
+        return self.result_cache.get(key)
+    
+    def _store_analysis(self, image_url: str, analysis: Dict):
+        """Persist a successful analysis so reruns skip the API call"""
+        if self.result_cache is None or not analysis.get('success'):
+            return
+        key = hashlib.sha1((self.cache_version + image_url).encode('utf-8')).hexdigest()
+        self.result_cache.set(key, analysis)
     
     def analyze_image(self, image_url: str) -> Dict:
         """Analyze image using configured service"""
@@ -158,134 +530,294 @@ class ImageAnalyzer:
                 'error': 'Invalid image URL'
             }
         
+        cached = self._cached_analysis(image_url)
+        if cached is not None:
+            return cached
+        
+        if not self._precheck(image_url):
+            return {'success': False, 'error': 'invalid_precheck'}
+        
         if self.service == 'google':
-            return self.analyze_image_google(image_url)
+            analysis = self.analyze_image_google(image_url)
         elif self.service == 'azure':
-            return self.analyze_image_azure(image_url)
+            analysis = self.analyze_image_azure(image_url)
+        
+        self._store_analysis(image_url, analysis)
+        return analysis
+    
+    def _analyze_chunk(self, image_urls: List[str], limiter: Optional[RateLimiter]) -> List[Dict]:
+        """Analyze one batch of image URLs once the rate limiter allows a call"""
+        if self.service != 'google':
+            if limiter:
+                limiter.acquire()
+            return [self.analyze_image(url) for url in image_urls]
+        
+        # Only URLs without a cached analysis that pass the precheck go to the API
+        results = [self._cached_analysis(url) for url in image_urls]
+        for i, url in enumerate(image_urls):
+            if results[i] is None and not self._precheck(url):
+                results[i] = {'success': False, 'error': 'invalid_precheck'}
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            if limiter:
+                limiter.acquire()
+            
+            fresh = self.analyze_images_google_batch([image_urls[i] for i in missing])
+            for i, analysis in zip(missing, fresh):
+                self._store_analysis(image_urls[i], analysis)
+                results[i] = analysis
+        
+        return results
+    
+    def csv_fields(self) -> List[str]:
+        """CSV header for this analyzer's service"""
+        return CSV_FIELDS + AZURE_CSV_FIELDS if self.service == 'azure' else CSV_FIELDS
+    
+    def _csv_row(self, campaign: Dict, analysis: Optional[Dict]) -> List[str]:
+        """Flatten one campaign and its analysis into a CSV row matching csv_fields()"""
+        return CampaignRow.from_analysis(campaign, analysis).values(self.csv_fields())
+    
+    def _open_outputs(self, results_file: str, csv_file: Optional[str]):
+        """Open the streamed results file, plus the CSV if one was asked for"""
+        self.results_file = results_file
+        self._results_handle = open(results_file, 'wb')
+        if csv_file:
+            self._csv_handle = open(csv_file, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.writer(self._csv_handle)
+            self._csv_writer.writerow(self.csv_fields())
     
-    def process_campaigns(self, campaigns: List[Dict], delay: float = 1.0) -> List[Dict]:
+    def _close_outputs(self):
+        """Close whatever _open_outputs opened"""
+        for handle in (self._results_handle, self._csv_handle):
+            if handle:
+                handle.close()
+        self._results_handle = self._csv_handle = self._csv_writer = None
+    
+    def _write_result(self, campaign: Dict, analysis: Dict):
+        """Append one campaign and its analysis to the JSON Lines results file (and CSV)"""
+        record = {**campaign, 'image_analysis': analysis}
+        self._results_handle.write(dumps_json(record) + b'\n')
+        self._results_handle.flush()
+        if self._csv_writer:
+            self._csv_writer.writerow(self._csv_row(campaign, analysis))
+            self._csv_handle.flush()
+    
+    def _write_ready(self, campaigns: List[Dict], analyses: List[Optional[Dict]]):
+        """Write out every finished campaign that no earlier unfinished one is holding back"""
+        while self._next_write < len(campaigns) and analyses[self._next_write] is not None:
+            self._write_result(campaigns[self._next_write], analyses[self._next_write])
+            self._next_write += 1
+    
+    def _record_chunk(self, chunk: List, chunk_analyses: List[Dict], analyses: List[Optional[Dict]]):
+        """Store analyses for their (index, campaign) pairs and report progress"""
+        total = len(analyses)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for (i, campaign), analysis in zip(chunk, chunk_analyses):
+            analyses[i - 1] = analysis
+            
+            success = analysis['success']
+            top_labels = analysis.get('top_labels', [])
+            if success:
+                self.label_counts.update(set(top_labels))
+            
+            if debug:
+                title = campaign.get('title', 'Unknown')[:50]
+                if success:
+                    logger.debug("[%d/%d] ✓ %s: %s", i, total, title, ', '.join(top_labels[:3]))
+                else:
+                    logger.debug("[%d/%d] ✗ %s: %s", i, total, title, analysis.get('error', 'Unknown error'))
+        
+        if self._progress is not None:
+            self._progress.update(len(chunk))
+    
+    def process_campaigns(self, campaigns: List[Dict], delay: float = 1.0, max_concurrency: int = 4,
+                          results_file: str = 'campaigns_with_image_analysis.jsonl',
+                          csv_file: Optional[str] = None) -> Tuple[List[Dict], List[Optional[Dict]]]:
         """
         Process multiple campaigns and analyze their images
         
+        Images are sent to Google Vision BATCH_SIZE at a time, with up to
+        max_concurrency batch calls in flight. Each campaign is appended with
+        its analysis to results_file (JSON Lines), and flattened into csv_file
+        if given, as soon as it and every campaign before it have finished, so
+        both files follow input order. The campaign dicts themselves are left
+        untouched.
+        
+        Returns:
+            (campaigns, analyses): analyses[i] is the analysis of campaigns[i]
+        
         Args:
             campaigns: List of campaign dicts with 'image_url' key
-            delay: Delay between API calls in seconds
+            delay: Average seconds between API calls (rate limit, independent of concurrency)
+            max_concurrency: Maximum number of API calls in flight at once
+            results_file: JSON Lines file the results are streamed to
+            csv_file: Optional CSV file the flattened rows are streamed to
         """
-        print(f"\nAnalyzing {len(campaigns)} images with {self.service.upper()} Vision API")
-        print("=" * 60)
+        logger.info("Analyzing %d images with %s Vision API", len(campaigns), self.service.upper())
         
-        enriched_campaigns = []
-        successful = 0
-        failed = 0
+        analyses: List[Optional[Dict]] = [None] * len(campaigns)
+        self.label_counts = Counter()
+        self._next_write = 0
         
-        for i, campaign in enumerate(campaigns, 1):
-            image_url = campaign.get('image_url', '')
-            
-            if not image_url:
-                print(f"[{i}/{len(campaigns)}] Skipping - No image URL")
-                campaign['image_analysis'] = {'success': False, 'error': 'No image URL'}
-                enriched_campaigns.append(campaign)
-                failed += 1
-                continue
-            
-            print(f"[{i}/{len(campaigns)}] Analyzing: {campaign.get('title', 'Unknown')[:50]}...")
-            
-            # Analyze image
-            analysis = self.analyze_image(image_url)
-            campaign['image_analysis'] = analysis
+        self._open_outputs(results_file, csv_file)
+        if TQDM_AVAILABLE:
+            self._progress = tqdm(total=len(campaigns), desc='Analyzing', unit='img', file=sys.stderr)
+        
+        try:
+            # Campaigns whose image can be sent to the API, in input order
+            to_analyze = []
+            image_urls = []
+            total = len(campaigns)
+            for i, campaign in enumerate(campaigns, 1):
+                image_url = campaign.get('image_url', '')
+                
+                if not image_url:
+                    logger.debug("[%d/%d] Skipping - No image URL", i, total)
+                    analyses[i - 1] = {'success': False, 'error': 'No image URL'}
+                elif not image_url.startswith('http'):
+                    logger.debug("[%d/%d] Skipping - Invalid image URL", i, total)
+                    analyses[i - 1] = {'success': False, 'error': 'Invalid image URL'}
+                else:
+                    to_analyze.append((i, campaign))
+                    image_urls.append(image_url)
             
-            if analysis['success']:
-                successful += 1
-                # Print top labels
-                top_labels = analysis.get('top_labels', [])
-                print(f"  ✓ Labels: {', '.join(top_labels[:3])}")
-            else:
-                failed += 1
-                print(f"  ✗ Failed: {analysis.get('error', 'Unknown error')}")
+            if self._progress is not None:
+                self._progress.update(total - len(to_analyze))
+            self._write_ready(campaigns, analyses)
             
-            enriched_campaigns.append(campaign)
+            chunks = list(chunked(to_analyze, self.BATCH_SIZE))
+            url_chunks = list(chunked(image_urls, self.BATCH_SIZE))
+            limiter = RateLimiter(1, delay) if delay > 0 else None
             
-            # Rate limiting
-            if i < len(campaigns):
-                time.sleep(delay)
+            # The Vision client is thread-safe, so every worker shares self.client
+            executor = ThreadPoolExecutor(max_workers=max_concurrency)
+            try:
+                futures_map = {}
+                for n, (chunk, urls) in enumerate(zip(chunks, url_chunks)):
+                    if 0 < n < max_concurrency:
+                        time.sleep(self.STAGGER_SECONDS)
+                    future = executor.submit(self._analyze_chunk, urls, limiter)
+                    futures_map[future] = chunk
+                
+                # Handle each batch as soon as it finishes, whatever order that is;
+                # _write_ready holds results back until earlier campaigns are done
+                for future in as_completed(futures_map):
+                    self._record_chunk(futures_map[future], future.result(), analyses)
+                    self._write_ready(campaigns, analyses)
+            finally:
+                # On Ctrl-C or a failed batch, don't send the queued batches to the paid API
+                executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            self._close_outputs()
+            if self._progress is not None:
+                self._progress.close()
+                self._progress = None
         
-        print("=" * 60)
-        print(f"Analysis complete!")
-        print(f"  Successful: {successful}")
-        print(f"  Failed: {failed}")
-        print(f"  Total: {len(campaigns)}")
+        successful = sum(1 for a in analyses if a and a.get('success'))
+        failed = len(campaigns) - successful
         
-        self.results = enriched_campaigns
-        return enriched_campaigns
+        logger.info("Analysis complete! Successful: %d, Failed: %d, Total: %d",
+                    successful, failed, len(campaigns))
+        logger.info("Results streamed to %s", results_file)
+        if csv_file:
+            logger.info("CSV streamed to %s", csv_file)
+        
+        return campaigns, analyses
+    
+    def iter_results(self):
+        """Yield (campaign, analysis) pairs back from the streamed results file"""
+        with open(self.results_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    record = loads_json(line)
+                    analysis = record.pop('image_analysis', None)
+                    yield record, analysis
     
     def save_results(self, output_file='campaigns_with_image_analysis.json'):
-        """Save enriched results to JSON file"""
-        if not self.results:
-            print("No results to save!")
+        """Save enriched results to a JSON array file, one streamed record at a time"""
+        if not self.results_file:
+            logger.warning("No results to save!")
             return
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(b'[')
+            for n, (campaign, analysis) in enumerate(self.iter_results()):
+                f.write(b',\n' if n else b'\n')
+                f.write(dumps_json({**campaign, 'image_analysis': analysis}))
+            f.write(b'\n]\n')
         
-        print(f"\n✓ Results saved to {output_file}")
+        logger.info("✓ Results saved to %s", output_file)
     
     def save_to_csv(self, output_file='campaigns_with_labels.csv'):
-        """Save flattened results to CSV"""
-        if not self.results:
-            print("No results to save!")
+        """Save flattened results to CSV, streamed from the results file"""
+        if not self.results_file:
+            logger.warning("No results to save!")
             return
         
-        rows = []
-        for campaign in self.results:
-            analysis = campaign.get('image_analysis', {})
-            
-            row = {
-                      
-                'url': campaign.get('url', ''),
-                'image_url': campaign.get('image_url', ''),
-                'amount_raised': campaign.get('amount_raised', ''),
-                'days_running': campaign.get('days_running', ''),
-                'description': campaign.get('description', ''),
-                'all_labels': ', '.join(analysis.get('top_labels', [])),
-       
-            }
-            
-            # Add service-specific fields
-            if self.service == 'azure' and 'captions' in analysis:
-                captions = analysis.get('captions', [])
-                row['image_caption'] = captions[0]['text'] if captions else ''
-                row['caption_confidence'] = captions[0]['confidence'] if captions else ''
-            
-            rows.append(row)
-        
-        # Write CSV
-        if rows:
-            keys = rows[0].keys()
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(rows)
-            
-            print(f"✓ CSV saved to {output_file}")
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.csv_fields())
+            for campaign, analysis in self.iter_results():
+                writer.writerow(self._csv_row(campaign, analysis))
+        
+        logger.info("✓ CSV saved to %s", output_file)
+    
+    def save_label_counts(self, output_file='label_counts.csv', top: Optional[int] = None):
+        """Save the label frequency histogram of the last run, most common first"""
+        if not self.label_counts:
+            logger.warning("No labels to save!")
+            return
+        
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['label', 'count'])
+            writer.writerows(self.label_counts.most_common(top))
+        
+        logger.info("✓ Label counts saved to %s", output_file)
 
 
 def load_campaigns_from_json(filepath='gofundme_animal_campaigns.json') -> List[Dict]:
     """Load campaigns from JSON file"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return loads_json(f.read())
+
+
+def load_campaigns_from_jsonl(filepath='gofundme_campaigns_final.jsonl') -> List[Dict]:
+    """Load campaigns from a JSON Lines file (one campaign per line)"""
+    with open(filepath, 'rb') as f:
+        return [loads_json(line) for line in f if line.strip()]
 
 
 def load_campaigns_from_csv(filepath='gofundme_animal_campaigns.csv') -> List[Dict]:
-    """Load campaigns from CSV file"""
-    campaigns = []
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        campaigns = list(reader)
-    return campaigns
+    """Load campaigns from CSV file, keeping only INPUT_CSV_FIELDS (all as strings)"""
+    with open(filepath, 'r', newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f), [])
+        columns = [name for name in INPUT_CSV_FIELDS if name in header]
+        
+        if not PYARROW_AVAILABLE:
+            return [
+                {name: row[name] for name in columns}
+                for row in csv.DictReader(f, fieldnames=header)
+            ]
+    
+    # Read every column as text, like csv.DictReader, so e.g. 'Unknown' days survive
+    # Scraped descriptions contain line breaks inside quoted fields
+    table = pacsv.read_csv(
+        filepath,
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={name: pa.string() for name in columns},
+            strings_can_be_null=False,
+        ),
+    )
+    return table.to_pylist()
 
 
 def main():
     """Main execution function"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stderr)
+    
     print("""
     ╔══════════════════════════════════════════════════════════╗
     ║  Image Analysis with Vision APIs                         ║
@@ -295,9 +827,10 @@ def main():
     
     # Configuration - CHANGE THESE
     SERVICE = 'google'  # or 'azure'
-    INPUT_FILE = 'gofundme_campaigns_final.json'  # or .csv
+    INPUT_FILE = 'gofundme_campaigns_final.jsonl'  # what the scraper streams; or .json / .csv
     MAX_IMAGES = 1000  # Limit for testing (APIs cost money!)
-    DELAY = 1.0  # Seconds between API calls
+    DELAY = 1.0  # Average seconds between API calls
+    MAX_CONCURRENCY = 4  # API calls in flight at once
     
     # Credentials - REPLACE WITH YOUR OWN
     credentials = {}
@@ -327,7 +860,9 @@ def main():
     
     # Load campaigns
     try:
-        if INPUT_FILE.endswith('.json'):
+        if INPUT_FILE.endswith('.jsonl'):
+            campaigns = load_campaigns_from_jsonl(INPUT_FILE)
+        elif INPUT_FILE.endswith('.json'):
             campaigns = load_campaigns_from_json(INPUT_FILE)
         else:
             campaigns = load_campaigns_from_csv(INPUT_FILE)
@@ -355,21 +890,24 @@ def main():
         return
     
     # Process campaigns
-    enriched_campaigns = analyzer.process_campaigns(campaigns, delay=DELAY)
+    campaigns, analyses = analyzer.process_campaigns(
+        campaigns, delay=DELAY, max_concurrency=MAX_CONCURRENCY,
+        results_file=f'campaigns_with_{SERVICE}_analysis.jsonl',
+        csv_file=f'campaigns_with_{SERVICE}_labels.csv'
+    )
     
-    # Save results
+    # Save results (the CSV was already streamed during processing)
     analyzer.save_results(f'campaigns_with_{SERVICE}_analysis.json')
-    analyzer.save_to_csv(f'campaigns_with_{SERVICE}_labels.csv')
+    analyzer.save_label_counts(f'campaigns_with_{SERVICE}_label_counts.csv')
     
     # Print sample results
     print("\n" + "=" * 60)
     print("SAMPLE RESULTS")
     print("=" * 60)
     
-    successful_campaigns = [c for c in enriched_campaigns if c.get('image_analysis', {}).get('success')]
-    if successful_campaigns:
-        sample = successful_campaigns[0]
-        analysis = sample['image_analysis']
+    successful = [(c, a) for c, a in zip(campaigns, analyses) if a and a.get('success')]
+    if successful:
+        sample, analysis = successful[0]
         
         print(f"\nCampaign: {sample.get('title', 'Unknown')[:60]}")
         print(f"Image: {sample.get('image_url', 'N/A')[:60]}...")